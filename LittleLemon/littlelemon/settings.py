@@ -46,6 +46,8 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'django.middleware.gzip.GZipMiddleware',
+    'django.middleware.http.ConditionalGetMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -74,6 +76,8 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'littlelemon.wsgi.application'
 
+ASGI_APPLICATION = 'littlelemon.asgi.application'
+
 
 # Database
 # https://docs.djangoproject.com/en/4.1/ref/settings/#databases
@@ -91,6 +95,13 @@ DATABASES = {
         'PASSWORD': getenv('DJANGO_DB_PASSWORD'),
         'HOST': getenv('DJANGO_DB_HOST'),
         'PORT': getenv('DJANGO_DB_PORT'),
+        # Keep connections open between requests instead of reconnecting
+        # each time, and check them before reuse. This only helps under
+        # WSGI: under ASGI every request runs in a new thread with its own
+        # connection, so set DJANGO_DB_CONN_MAX_AGE=0 there and leave
+        # pooling to an external pooler such as ProxySQL.
+        'CONN_MAX_AGE': int(getenv('DJANGO_DB_CONN_MAX_AGE', 60)),
+        'CONN_HEALTH_CHECKS': True,
         'OPTIONS': {
             'init_command': "SET sql_mode='STRICT_TRANS_TABLES'"
         },
@@ -146,10 +157,17 @@ REST_FRAMEWORK = {
         'rest_framework.authentication.SessionAuthentication',
     ],
 
+    # The browsable API re-serializes and builds HTML forms on every
+    # browser GET, so only offer it while developing.
     'DEFAULT_RENDERER_CLASSES': [
         'rest_framework.renderers.JSONRenderer',
-        'rest_framework.renderers.BrowsableAPIRenderer',
-    ],
+    ] + (['rest_framework.renderers.BrowsableAPIRenderer'] if DEBUG else []),
+
+    # Only applied to views that opt in with throttle_classes
+    'DEFAULT_THROTTLE_RATES': {
+        'anon': '20/minute',
+        'user': '60/minute',
+    },
 }
 
 DJOSER = {
@@ -0,0 +1,56 @@
+from functools import partial
+from hashlib import md5
+
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.http import urlencode
+from rest_framework.pagination import PageNumberPagination
+
+
+class CountedPaginator(Paginator):
+    def __init__(self, object_list, per_page, count, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.count = count
+
+
+class CachedCountPaginator(PageNumberPagination):
+    """
+    Page number pagination that caches the result of COUNT(*) for the rest
+    of a client's walk through the pages. The count is refreshed whenever
+    the first page is requested. Pagination is opt-in via ?page_size=.
+
+    The count lives in the default cache. Without a shared CACHES backend
+    that is a per-process LocMemCache, so with several server workers a
+    refresh on page 1 only reaches the worker that served it, and other
+    workers may report a count up to count_cache_timeout seconds old.
+    """
+    page_size_query_param = 'page_size'
+    count_cache_timeout = 300
+
+    def get_count_cache_key(self, request):
+        # The count does not depend on which page is shown or how big it
+        # is, so leave those out and sort the rest for a stable key.
+        ignored = (self.page_query_param, self.page_size_query_param)
+        params = sorted(
+            (key, sorted(values)) for key, values in request.query_params.lists()
+            if key not in ignored
+        )
+        # Hash the URL, as Django's own cache key helpers do, so client
+        # supplied parameters cannot push the key past backend limits.
+        url = f'{request.path}?{urlencode(params, doseq=True)}'
+        return f'pagination-count:{md5(url.encode()).hexdigest()}'
+
+    def get_count(self, queryset, request):
+        key = self.get_count_cache_key(request)
+        if request.query_params.get(self.page_query_param, '1') == '1':
+            count = queryset.count()
+            cache.set(key, count, self.count_cache_timeout)
+            return count
+        return cache.get_or_set(key, queryset.count, self.count_cache_timeout)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.get_page_size(request) is None:
+            return None
+        count = self.get_count(queryset, request)
+        self.django_paginator_class = partial(CountedPaginator, count=count)
+        return super().paginate_queryset(queryset, request, view)
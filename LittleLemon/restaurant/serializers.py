@@ -1,22 +1,52 @@
+from copy import deepcopy
+
 from django.contrib.auth.models import User
+from django.utils.functional import cached_property
 from rest_framework import serializers
 
 from .models import Booking, MenuItem
 
 
-class UserSerializer(serializers.ModelSerializer):
+_FIELDS_CACHE = {}
+
+
+class CachedFieldsMixin:
+    # ModelSerializer introspects the model to build its fields on every
+    # instantiation, so do that once per class. Hand out deep copies, as DRF
+    # does for declared fields, so nested fields such as child_relation and
+    # validators are never shared between instances.
+    def get_fields(self):
+        cls = type(self)
+        if cls not in _FIELDS_CACHE:
+            _FIELDS_CACHE[cls] = super().get_fields()
+        return deepcopy(_FIELDS_CACHE[cls])
+
+    # DRF filters `fields` again on every to_representation() and
+    # to_internal_value() call; with many=True the same child serializer
+    # handles every row, so filter once per instance.
+    @cached_property
+    def _readable_fields(self):
+        return [field for field in self.fields.values() if not field.write_only]
+
+    @cached_property
+    def _writable_fields(self):
+        return [field for field in self.fields.values() if not field.read_only]
+
+
+class UserSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = User
         fields = ['url', 'username', 'email', 'groups']
 
 
-class MenuItemSerializer(serializers.ModelSerializer):
+class MenuItemSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = MenuItem
         fields = ['title', 'price', 'inventory']
+        extra_kwargs = {'price': {'coerce_to_string': False}}
         
 
-class BookingSerializer(serializers.ModelSerializer):
+class BookingSerializer(CachedFieldsMixin, serializers.ModelSerializer):
     class Meta:
         model = Booking
         fields = '__all__'
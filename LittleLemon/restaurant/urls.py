@@ -7,6 +7,7 @@ urlpatterns = [
     path('', views.index, name='index'),
 
     path('api-token-auth/', obtain_auth_token),
+    path('users/exists/', views.user_exists, name='user-exists'),
 
     path('menu/', views.MenuItemView.as_view(), name='menu-list'),
     path('menu/<int:pk>', views.SingleMenuItemView.as_view(), name='menu-detail'),
@@ -1,8 +1,15 @@
 from django.contrib.auth.models import User
 from django.shortcuts import render
-from rest_framework import generics, permissions, viewsets
+from django.utils.cache import patch_cache_control
+from django.utils.decorators import method_decorator
+from django.views.decorators.vary import vary_on_headers
+from rest_framework import generics, permissions, status, viewsets
+from rest_framework.decorators import api_view, throttle_classes
+from rest_framework.response import Response
+from rest_framework.throttling import AnonRateThrottle, UserRateThrottle
 
 from .models import Booking, MenuItem
+from .pagination import CachedCountPaginator
 from .serializers import BookingSerializer, MenuItemSerializer, UserSerializer
 
 
@@ -10,15 +17,68 @@ def index(request):
     return render(request, 'index.html', {})
 
 
+@api_view(['GET'])
+# Throttled so the endpoint cannot be used to enumerate usernames cheaply
+@throttle_classes([AnonRateThrottle, UserRateThrottle])
+def user_exists(request):
+    username = request.query_params.get('username')
+    if not username:
+        return Response({'username': ['This query parameter is required.']},
+                        status=status.HTTP_400_BAD_REQUEST)
+    return Response({'exists': User.objects.filter(username=username).exists()})
+
+
 class UserViewSet(viewsets.ModelViewSet):
-    queryset = User.objects.all()
+    queryset = User.objects.all().prefetch_related('groups')
     serializer_class = UserSerializer
     permission_classes = [permissions.IsAuthenticated]
 
 
 class MenuItemView(generics.ListCreateAPIView):
-    queryset = MenuItem.objects.all()
+    queryset = MenuItem.objects.order_by('id')
     serializer_class = MenuItemSerializer
+    pagination_class = CachedCountPaginator
+    bulk_create_max_items = 1000
+    bulk_create_batch_size = 100
+
+    # The menu is public and rarely changes, so let proxies and browsers
+    # reuse a JSON listing for a short while. The browsable API page embeds
+    # a CSRF token and must not be shared.
+    @method_decorator(vary_on_headers('Accept'))
+    def get(self, request, *args, **kwargs):
+        response = super().get(request, *args, **kwargs)
+        if request.accepted_renderer.format == 'json':
+            patch_cache_control(response, public=True, max_age=60)
+        return response
+
+    def get_serializer(self, *args, **kwargs):
+        # A non-empty list payload creates several menu items in one request
+        if isinstance(kwargs.get('data'), list):
+            kwargs['many'] = True
+            kwargs['allow_empty'] = False
+            kwargs['max_length'] = self.bulk_create_max_items
+        return super().get_serializer(*args, **kwargs)
+
+    def perform_create(self, serializer):
+        if isinstance(serializer.validated_data, list):
+            serializer.instance = MenuItem.objects.bulk_create(
+                (MenuItem(**item) for item in serializer.validated_data),
+                batch_size=self.bulk_create_batch_size
+            )
+        else:
+            serializer.save()
+
+    def list(self, request, *args, **kwargs):
+        # Reads bypass the serializer: a values() projection returns plain
+        # dicts without building model instances or calling each field's
+        # to_representation. The JSON renderer emits price as a number,
+        # matching the serializer. Writes still go through the serializer.
+        fields = self.get_serializer_class().Meta.fields
+        queryset = self.filter_queryset(self.get_queryset()).values(*fields)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(page)
+        return Response(list(queryset))
 
 
 class SingleMenuItemView(generics.RetrieveUpdateDestroyAPIView):
@@ -27,6 +87,7 @@ class SingleMenuItemView(generics.RetrieveUpdateDestroyAPIView):
 
 
 class BookingViewSet(viewsets.ModelViewSet):
-    queryset = Booking.objects.all()
+    queryset = Booking.objects.order_by('id')
     serializer_class = BookingSerializer
+    pagination_class = CachedCountPaginator
     permission_classes = [permissions.IsAuthenticated]
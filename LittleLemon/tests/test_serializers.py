@@ -0,0 +1,24 @@
+from django.test import TestCase
+from restaurant.serializers import UserSerializer
+
+
+class CachedFieldsMixinTests(TestCase):
+    def setUp(self):
+        self.first = UserSerializer(context={'request': 'first'})
+        self.second = UserSerializer(context={'request': 'second'})
+
+    def test_fields_are_not_shared(self):
+        first_groups = self.first.fields['groups']
+        second_groups = self.second.fields['groups']
+        self.assertIsNot(first_groups, second_groups)
+        self.assertIsNot(first_groups.child_relation, second_groups.child_relation)
+        self.assertIsNot(
+            self.first.fields['username'].validators,
+            self.second.fields['username'].validators
+        )
+
+    def test_nested_fields_are_bound_to_their_serializer(self):
+        for serializer in (self.first, self.second):
+            child_relation = serializer.fields['groups'].child_relation
+            self.assertIs(child_relation.root, serializer)
+            self.assertEqual(child_relation.context, serializer.context)
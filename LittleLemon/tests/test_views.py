@@ -1,11 +1,18 @@
-from django.contrib.auth.models import User
+from django.contrib.auth.models import Group, User
+from django.core.cache import cache
+from django.core.cache.backends.base import CacheKeyWarning
 from django.urls import reverse
 from django.test import TestCase, Client
 import json
+from unittest import mock
+import warnings
 from rest_framework import status
+from rest_framework.renderers import BrowsableAPIRenderer, JSONRenderer
+from rest_framework.throttling import AnonRateThrottle
 from rest_framework.test import APITestCase
 
 from restaurant.models import Booking, MenuItem
+from restaurant.views import MenuItemView, UserViewSet
 
 ###
 # Tests using django.test.TestCase
@@ -28,6 +35,8 @@ class MenuView_Tests(TestCase):
         self.assertEqual(len(data), 2)
         self.assertEqual(data[0]['title'], self.menu1.title)
         self.assertEqual(data[1]['title'], self.menu2.title)
+        self.assertEqual(data[0]['price'], 12.5)
+        self.assertEqual(data[1]['inventory'], 20)
 
     def test_create_menu_item(self):
         new_item = {
@@ -44,6 +53,22 @@ class MenuView_Tests(TestCase):
         self.assertEqual(MenuItem.objects.count(), 3)
         self.assertEqual(MenuItem.objects.latest('id').title, 'Salad')
 
+    def test_menu_list_query_count_does_not_grow_with_items(self):
+        MenuItem.objects.bulk_create(
+            MenuItem(title=f'Item {i}', price=5, inventory=1) for i in range(18)
+        )
+        with self.assertNumQueries(1):
+            response = self.client.get(self.list_url)
+        self.assertEqual(len(json.loads(response.content)), 20)
+
+    def test_menu_list_is_gzipped(self):
+        MenuItem.objects.bulk_create(
+            MenuItem(title=f'Item {i}', price=5, inventory=1) for i in range(10)
+        )
+        response = self.client.get(self.list_url, HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Encoding'], 'gzip')
+
 
 class SingleMenuItemView_Tests(TestCase):
     def setUp(self):
@@ -56,7 +81,7 @@ class SingleMenuItemView_Tests(TestCase):
         self.assertEqual(response.status_code, 200)
         data = json.loads(response.content)
         self.assertEqual(data['title'], self.menu.title)
-        self.assertEqual(float(data['price']), float(self.menu.price))
+        self.assertEqual(data['price'], float(self.menu.price))
 
     def test_update_menu_item(self):
         updated_data = {
@@ -109,7 +134,9 @@ class BookingViewSet_Tests(TestCase):
         self.detail_url = reverse('booking-detail', args=[self.booking.id])
 
     def test_list_bookings(self):
-        response = self.client.get(self.list_url)
+        # Session + user lookups for authentication, then one bookings query
+        with self.assertNumQueries(3):
+            response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, 200)
         data = json.loads(response.content)
         self.assertEqual(len(data), 1)
@@ -160,6 +187,42 @@ class BookingViewSet_Tests(TestCase):
         response = self.client.get(self.list_url)
         self.assertEqual(response.status_code, 401)
 
+class UserViewSet_Tests(TestCase):
+    # UserViewSet is not registered with any router, and UserSerializer's
+    # url field points at a user-detail route that does not exist, so the
+    # queryset is exercised directly rather than through an HTTP request.
+    def setUp(self):
+        group = Group.objects.create(name='staff')
+        for i in range(10):
+            user = User.objects.create_user(username=f'user{i}', password='testpass')
+            user.groups.add(group)
+
+    def test_groups_are_prefetched(self):
+        # One query for the users and one for all of their groups
+        with self.assertNumQueries(2):
+            users = list(UserViewSet.queryset.all())
+            for user in users:
+                list(user.groups.all())
+        self.assertEqual(len(users), 10)
+
+
+class BookingListQueries_Tests(TestCase):
+    def setUp(self):
+        self.client = Client()
+        User.objects.create_user(username='testuser', password='testpass')
+        self.client.login(username='testuser', password='testpass')
+        Booking.objects.bulk_create(
+            Booking(name=f'Guest {i}', no_of_guests=2) for i in range(20)
+        )
+        self.list_url = reverse('booking-list')
+
+    def test_list_query_count_does_not_grow_with_bookings(self):
+        # Same three queries as for a single booking in BookingViewSet_Tests
+        with self.assertNumQueries(3):
+            response = self.client.get(self.list_url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(json.loads(response.content)), 20)
+
 ###
 # Tests using rest_framework.test.APITestCase
 ###
@@ -177,6 +240,66 @@ class MenuViewTests(APITestCase):
         self.assertEqual(response.data[0]['title'], self.menu1.title)
         self.assertEqual(response.data[1]['title'], self.menu2.title)
 
+    def test_menu_list_is_publicly_cacheable(self):
+        # With a single renderer DRF adds no Vary header of its own
+        with mock.patch.object(MenuItemView, 'renderer_classes', [JSONRenderer]):
+            response = self.client.get(self.list_url)
+        cache_control = [token.strip() for token in response['Cache-Control'].split(',')]
+        vary = [token.strip() for token in response['Vary'].split(',')]
+        self.assertIn('public', cache_control)
+        self.assertIn('max-age=60', cache_control)
+        self.assertIn('Accept', vary)
+
+    def test_browsable_menu_list_is_not_publicly_cacheable(self):
+        # The browsable renderer is only configured when DEBUG is on
+        renderers = [JSONRenderer, BrowsableAPIRenderer]
+        with mock.patch.object(MenuItemView, 'renderer_classes', renderers):
+            response = self.client.get(self.list_url, HTTP_ACCEPT='text/html')
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.has_header('Cache-Control'))
+
+    def test_menu_list_honours_etag(self):
+        response = self.client.get(self.list_url)
+        self.assertTrue(response.has_header('ETag'))
+        response = self.client.get(self.list_url, HTTP_IF_NONE_MATCH=response['ETag'])
+        self.assertEqual(response.status_code, status.HTTP_304_NOT_MODIFIED)
+
+    def test_get_paginated_menu_list(self):
+        cache.clear()
+        response = self.client.get(self.list_url, {'page_size': 1})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        self.assertEqual(len(response.data['results']), 1)
+        self.assertEqual(response.data['results'][0]['title'], self.menu1.title)
+
+    def test_paginated_count_is_cached_after_first_page(self):
+        cache.clear()
+        self.client.get(self.list_url, {'page_size': 1})
+        MenuItem.objects.create(title='Salad', price=7.00, inventory=15)
+
+        response = self.client.get(self.list_url, {'page_size': 1, 'page': 2})
+        self.assertEqual(response.data['count'], 2)
+
+        response = self.client.get(self.list_url, {'page_size': 1})
+        self.assertEqual(response.data['count'], 3)
+
+    def test_paginated_count_key_is_bounded_for_long_query_strings(self):
+        cache.clear()
+        url = self.list_url + '?page_size=1&page=2&junk=' + 'x' * 300
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', CacheKeyWarning)
+            response = self.client.get(url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+
+    def test_paginated_count_key_ignores_page_size_and_param_order(self):
+        cache.clear()
+        self.client.get(self.list_url + '?page_size=2&a=1&b=2')
+        MenuItem.objects.create(title='Salad', price=7.00, inventory=15)
+
+        response = self.client.get(self.list_url + '?b=2&page=2&a=1&page_size=1')
+        self.assertEqual(response.data['count'], 2)
+
     def test_create_menu_item(self):
         data = {
             'title': 'Salad',
@@ -188,6 +311,46 @@ class MenuViewTests(APITestCase):
         self.assertEqual(MenuItem.objects.count(), 3)
         self.assertEqual(MenuItem.objects.last().title, 'Salad')
 
+    def test_bulk_create_menu_items(self):
+        data = [
+            {'title': 'Salad', 'price': 7.00, 'inventory': 15},
+            {'title': 'Soup', 'price': 5.50, 'inventory': 12},
+        ]
+        with self.assertNumQueries(1):
+            response = self.client.post(self.list_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(len(response.data), 2)
+        self.assertEqual(MenuItem.objects.count(), 4)
+        self.assertEqual(MenuItem.objects.last().title, 'Soup')
+
+    def test_bulk_create_is_rejected_if_any_item_is_invalid(self):
+        data = [
+            {'title': 'Salad', 'price': 7.00, 'inventory': 15},
+            {'title': 'Soup', 'price': 'free'},
+        ]
+        response = self.client.post(self.list_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(MenuItem.objects.count(), 2)
+
+    def test_bulk_create_rejects_an_empty_list(self):
+        response = self.client.post(self.list_url, [], format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_bulk_create_rejects_too_many_items(self):
+        data = [{'title': 'Soup', 'price': 5.50, 'inventory': 12}] * 3
+        with mock.patch.object(MenuItemView, 'bulk_create_max_items', 2):
+            response = self.client.post(self.list_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(MenuItem.objects.count(), 2)
+
+    def test_bulk_create_inserts_in_batches(self):
+        data = [{'title': f'Soup {i}', 'price': 5.50, 'inventory': 12} for i in range(3)]
+        with mock.patch.object(MenuItemView, 'bulk_create_batch_size', 2):
+            with self.assertNumQueries(2):
+                response = self.client.post(self.list_url, data, format='json')
+        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
+        self.assertEqual(MenuItem.objects.count(), 5)
+
 
 class SingleMenuItemViewTests(APITestCase):
     def setUp(self):
@@ -223,6 +386,33 @@ class SingleMenuItemViewTests(APITestCase):
         self.assertFalse(MenuItem.objects.filter(id=self.menu_item.id).exists())
 
 
+class UserExistsViewTests(APITestCase):
+    def setUp(self):
+        User.objects.create_user(username='testuser', password='testpass')
+        self.url = reverse('user-exists')
+
+    def test_existing_user(self):
+        response = self.client.get(self.url, {'username': 'testuser'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertTrue(response.data['exists'])
+
+    def test_unknown_user(self):
+        response = self.client.get(self.url, {'username': 'nobody'})
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertFalse(response.data['exists'])
+
+    def test_missing_username(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_anonymous_requests_are_throttled(self):
+        cache.clear()
+        with mock.patch.object(AnonRateThrottle, 'THROTTLE_RATES', {'anon': '1/minute'}):
+            self.client.get(self.url, {'username': 'testuser'})
+            response = self.client.get(self.url, {'username': 'nobody'})
+        self.assertEqual(response.status_code, status.HTTP_429_TOO_MANY_REQUESTS)
+
+
 class BookingViewSetTests(APITestCase):
     def setUp(self):
         # Create and authenticate a user
@@ -1,7 +1,14 @@
 import requests
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "http://localhost:8000"
 
+# Shared session so every call reuses pooled connections to the API
+# instead of opening a new one per request.
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+SESSION.mount("https://", HTTPAdapter(pool_connections=10, pool_maxsize=50))
+
 
 def create_user_if_not_exists(username, password, email):
     """
@@ -13,7 +20,8 @@ def create_user_if_not_exists(username, password, email):
         email (str): The email address for the new user.
 
     Behavior:
-        - Sends a POST request to the API endpoint `/auth/users/`.
+        - Checks `/restaurant/users/exists/` first and prints a warning if the user already exists.
+        - Otherwise sends a POST request to the API endpoint `/auth/users/`.
         - If the user is created successfully (HTTP 201), prints a success message.
         - If the user already exists (HTTP 400), prints a warning.
         - If another error occurs, prints the error details.
@@ -24,19 +32,25 @@ def create_user_if_not_exists(username, password, email):
     Example:
         create_user_if_not_exists("johndoe", "securepassword", "john@example.com")
     """
+    exists_response = SESSION.get(f"{BASE_URL}/restaurant/users/exists/", params={"username": username})
+
+    if exists_response.status_code == 200 and exists_response.json().get("exists"):
+        print(f"⚠️ User '{username}' already exists.")
+        return
+
     user_data = {
         "username": username,
         "password": password,
         "email": email
     }
 
-    response = requests.post(f"{BASE_URL}/auth/users/", json=user_data)
+    response = SESSION.post(f"{BASE_URL}/auth/users/", json=user_data)
 
     if response.status_code == 201:
         print(f"✅ User '{username}' created successfully.")
     elif response.status_code == 400:
         errors = response.json()
-        if 'username' in errors and 'already exists' in str(errors['username']):
+        if any('already exists' in message for message in errors.get('username', [])):
             print(f"⚠️ User '{username}' already exists.")
         else:
             print(f"❌ User creation failed: {errors}")
@@ -70,7 +84,7 @@ def authenticate_user(username, password):
         "password": password
     }
 
-    auth_response = requests.post(f"{BASE_URL}/auth/token/login/", data=auth_data)
+    auth_response = SESSION.post(f"{BASE_URL}/auth/token/login/", data=auth_data)
 
     if auth_response.status_code == 200:
         token = auth_response.json().get("auth_token")
@@ -104,7 +118,7 @@ def get_current_user(auth_token):
         "Content-Type": "application/json"
     }
 
-    auth_response = requests.get(f"{BASE_URL}/auth/users/me/", headers=headers)
+    auth_response = SESSION.get(f"{BASE_URL}/auth/users/me/", headers=headers)
 
     if auth_response.status_code == 200:
         username = auth_response.json().get("username")
@@ -117,7 +131,7 @@ def get_current_user(auth_token):
 
 def create_menu_items(auth_token, menu_items_list):
     """
-    Creates multiple menu items by sending POST requests to the API.
+    Creates multiple menu items by sending a single bulk POST request to the API.
 
     Parameters:
         auth_token (str): The authentication token for the API.
@@ -132,19 +146,21 @@ def create_menu_items(auth_token, menu_items_list):
         create_menu_items("your_token_here", menu_items)
 
     Outputs:
-        Prints a success or failure message for each item created.
+        Prints a success message for each item created, or a failure message
+        if the batch is rejected.
     """
     headers = {
         "Authorization": f"Token {auth_token}",
         "Content-Type": "application/json"
     }
 
-    for item in menu_items_list:
-        response = requests.post(f"{BASE_URL}/restaurant/menu/", json=item, headers=headers)
-        if response.status_code == 201:
+    response = SESSION.post(f"{BASE_URL}/restaurant/menu/", json=menu_items_list, headers=headers)
+
+    if response.status_code == 201:
+        for item in response.json():
             print(f"✅ Created '{item['title']}' menu item.")
-        else:
-            print(f"❌ Failed to create '{item['title']}': {response.status_code} - {response.text}")
+    else:
+        print(f"❌ Failed to create menu items: {response.status_code} - {response.text}")
 
 
 def count_menu_items(auth_token):
@@ -172,7 +188,7 @@ def count_menu_items(auth_token):
         "Authorization": f"Token {auth_token}"
     }
 
-    response = requests.get(f"{BASE_URL}/restaurant/menu/", headers=headers)
+    response = SESSION.get(f"{BASE_URL}/restaurant/menu/", headers=headers)
 
     if response.status_code == 200:
         menu_items = response.json()
@@ -212,7 +228,7 @@ def add_a_table_booking(auth_token):
         "booking_date": "2025-04-20T18:30:00Z"  # Use ISO 8601 format
     }
 
-    response = requests.post(f"{BASE_URL}/restaurant/booking/tables/", json=booking_data, headers=headers)
+    response = SESSION.post(f"{BASE_URL}/restaurant/booking/tables/", json=booking_data, headers=headers)
 
     if response.status_code == 201:
         print("✅ Table booking added:", response.json())
@@ -246,7 +262,7 @@ def list_bookings(auth_token):
         "Authorization": f"Token {auth_token}"
     }
 
-    response = requests.get(f"{BASE_URL}/restaurant/booking/tables/", headers=headers)
+    response = SESSION.get(f"{BASE_URL}/restaurant/booking/tables/", headers=headers)
 
     if response.status_code == 200:
         bookings = response.json()